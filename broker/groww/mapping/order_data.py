@@ -1,7 +1,6 @@
 import os
 import datetime
 import json
-import pandas as pd
 import re
 from typing import Dict, List, Any, Optional
 from database.token_db import get_symbol 